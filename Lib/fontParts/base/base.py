@@ -107,6 +107,31 @@ def interpolate(a, b, v):
     return a + (b - a) * v
 
 
+def appendGuidelineCopies(obj, guidelines, offset=(0, 0)):
+    """
+    Append copies of guidelines to obj and return the new guidelines.
+    """
+    dx, dy = offset
+    existing = set([g.identifier for g in obj.guidelines
+                    if g.identifier is not None])
+    appended = []
+    for source in guidelines:
+        identifier = source.identifier
+        if identifier in existing:
+            identifier = None
+        x, y = source.position
+        appended.append(obj._appendGuideline(
+            (x + dx, y + dy),
+            source.angle,
+            name=source.name,
+            color=source.color,
+            identifier=identifier
+        ))
+        if identifier is not None:
+            existing.add(identifier)
+    return appended
+
+
 # ------------
 # Base Objects
 # ------------
@@ -211,10 +236,9 @@ class BaseObject(object):
         If so, they should call the super.
         """
         for attr in self.copyAttributes:
-            selfValue = getattr(self, attr)
             sourceValue = getattr(source, attr)
-            if isinstance(selfValue, BaseObject):
-                selfValue.copyData(sourceValue)
+            if isinstance(sourceValue, BaseObject):
+                getattr(self, attr).copyData(sourceValue)
             else:
                 setattr(self, attr, sourceValue)
 
@@ -646,16 +670,22 @@ class InterpolationMixin(object):
 
     compatibilityReporterClass = None
 
-    def isCompatible(self, other, cls):
+    def isCompatible(self, other, cls, stopOnFatal=False):
         """
         Evaluate interpolation compatibility with other.
+        If **stopOnFatal** is ``True``, the evaluation
+        may stop as soon as a fatal incompatibility
+        has been found.
         """
-        if not isinstance(other, cls):
+        # comparing exact types first avoids the MRO walk
+        # of isinstance when both objects have the same class.
+        if type(other) is not type(self) and not isinstance(other, cls):
             raise TypeError(
                 """Compatibility between an instance of %r and an \
                 instance of %r can not be checked."""
                 % (cls.__name__, other.__class__.__name__))
         reporter = self.compatibilityReporterClass(self, other)
+        reporter.stopOnFatal = normalizers.normalizeBoolean(stopOnFatal)
         self._isCompatible(other, reporter)
         return not reporter.fatal, reporter
 
@@ -1,5 +1,24 @@
 from fontParts.base.base import dynamicProperty
 
+# the report templates are bound once so that each
+# formatted line only costs a single format call.
+
+_fatalFormat = "[Fatal] {objectName}: {text}".format
+_warningFormat = "[Warning] {objectName}: {text}".format
+_okFormat = "[OK] {objectName}: {text}".format
+_countDifferenceFormat = (
+    "{object1Name} contains {object1Count} {subObjectName} | "
+    "{object2Name} contains {object2Count} {subObjectName}"
+).format
+_orderDifferenceFormat = (
+    "{object1Name} has {subObjectName} ordered {object1Order} | "
+    "{object2Name} has {object2Order}"
+).format
+_differencesFormat = (
+    "{object1Name} contains {subObjectName} {subObjectID} "
+    "not in {object2Name}"
+).format
+
 # ----
 # Base
 # ----
@@ -17,6 +36,7 @@ class BaseCompatibilityReporter(object):
 
     fatal = False
     warning = False
+    stopOnFatal = False
 
     def _get_title(self):
         title = "{object1Name} + {object2Name}".format(
@@ -72,13 +92,13 @@ class BaseCompatibilityReporter(object):
         raise NotImplementedError
 
     def formatFatalString(self, text):
-        return "[Fatal] {objectName}: ".format(objectName=self.objectName) + text
+        return _fatalFormat(objectName=self.objectName, text=text)
 
     def formatWarningString(self, text):
-        return "[Warning] {objectName}: ".format(objectName=self.objectName) + text
+        return _warningFormat(objectName=self.objectName, text=text)
 
     def formatOKString(self, text):
-        return "[OK] {objectName}: ".format(objectName=self.objectName) + text
+        return _okFormat(objectName=self.objectName, text=text)
 
     @staticmethod
     def reportSubObjects(reporters, showOK=True, showWarnings=True):
@@ -92,8 +112,7 @@ class BaseCompatibilityReporter(object):
     def reportCountDifference(subObjectName,
                               object1Name, object1Count,
                               object2Name, object2Count):
-        text = ("{object1Name} contains {object1Count} {subObjectName} | "
-                "{object2Name} contains {object2Count} {subObjectName}").format(
+        text = _countDifferenceFormat(
             subObjectName=subObjectName,
             object1Name=object1Name,
             object1Count=object1Count,
@@ -106,8 +125,7 @@ class BaseCompatibilityReporter(object):
     def reportOrderDifference(subObjectName,
                               object1Name, object1Order,
                               object2Name, object2Order):
-        text = ("{object1Name} has {subObjectName} ordered {object1Order} | "
-                "{object2Name} has {object2Order}").format(
+        text = _orderDifferenceFormat(
             subObjectName=subObjectName,
             object1Name=object1Name,
             object1Order=object1Order,
@@ -119,12 +137,11 @@ class BaseCompatibilityReporter(object):
     @staticmethod
     def reportDifferences(object1Name, subObjectName,
                           subObjectID, object2Name):
-        text = ("{object1Name} contains {subObjectName} {subObjectID} "
-                "not in {object2Name}").format(
-                object1Name=object1Name,
-                subObjectName=subObjectName,
-                subObjectID=subObjectID,
-                object2Name=object2Name,
+        text = _differencesFormat(
+            object1Name=object1Name,
+            subObjectName=subObjectName,
+            subObjectID=subObjectID,
+            object2Name=object2Name,
         )
         return text
 
@@ -155,55 +172,57 @@ class FontCompatibilityReporter(BaseCompatibilityReporter):
     def report(self, showOK=True, showWarnings=True):
         font1 = self.font1
         font2 = self.font2
+        font1Name = self.font1Name
+        font2Name = self.font2Name
         report = []
         if self.guidelineCountDifference:
             text = self.reportCountDifference(
                 subObjectName="guidelines",
-                object1Name=self.font1Name,
+                object1Name=font1Name,
                 object1Count=len(font1.guidelines),
-                object2Name=self.font2Name,
+                object2Name=font2Name,
                 object2Count=len(font2.guidelines)
             )
             report.append(self.formatWarningString(text))
         for name in self.guidelinesMissingFromFont2:
             text = self.reportDifferences(
-                object1Name=self.font1Name,
+                object1Name=font1Name,
                 subObjectName="guideline",
                 subObjectID=name,
-                object2Name=self.font2Name,
+                object2Name=font2Name,
             )
             report.append(self.formatWarningString(text))
         for name in self.guidelinesMissingInFont1:
             text = self.reportDifferences(
-                object1Name=self.font2Name,
+                object1Name=font2Name,
                 subObjectName="guideline",
                 subObjectID=name,
-                object2Name=self.font1Name,
+                object2Name=font1Name,
             )
             report.append(self.formatWarningString(text))
         if self.layerCountDifference:
             text = self.reportCountDifference(
                 subObjectName="layers",
-                object1Name=self.font1Name,
+                object1Name=font1Name,
                 object1Count=len(font1.layerOrder),
-                object2Name=self.font2Name,
+                object2Name=font2Name,
                 object2Count=len(font2.layerOrder)
             )
             report.append(self.formatWarningString(text))
         for name in self.layersMissingFromFont2:
             text = self.reportDifferences(
-                object1Name=self.font1Name,
+                object1Name=font1Name,
                 subObjectName="layer",
                 subObjectID=name,
-                object2Name=self.font2Name,
+                object2Name=font2Name,
             )
             report.append(self.formatWarningString(text))
         for name in self.layersMissingInFont1:
             text = self.reportDifferences(
-                object1Name=self.font2Name,
+                object1Name=font2Name,
                 subObjectName="layer",
                 subObjectID=name,
-                object2Name=self.font1Name,
+                object2Name=font1Name,
             )
             report.append(self.formatWarningString(text))
         report += self.reportSubObjects(self.layers, showOK=showOK,
@@ -237,30 +256,32 @@ class LayerCompatibilityReporter(BaseCompatibilityReporter):
     def report(self, showOK=True, showWarnings=True):
         layer1 = self.layer1
         layer2 = self.layer2
+        layer1Name = self.layer1Name
+        layer2Name = self.layer2Name
         report = []
         if self.glyphCountDifference:
             text = self.reportCountDifference(
                 subObjectName="glyphs",
-                object1Name=self.layer1Name,
+                object1Name=layer1Name,
                 object1Count=len(layer1),
-                object2Name=self.layer2Name,
+                object2Name=layer2Name,
                 object2Count=len(layer2)
             )
             report.append(self.formatWarningString(text))
         for name in self.glyphsMissingFromLayer2:
             text = self.reportDifferences(
-                object1Name=self.layer1Name,
+                object1Name=layer1Name,
                 subObjectName="glyph",
                 subObjectID=name,
-                object2Name=self.layer2Name,
+                object2Name=layer2Name,
             )
             report.append(self.formatWarningString(text))
         for name in self.glyphsMissingInLayer1:
             text = self.reportDifferences(
-                object1Name=self.layer2Name,
+                object1Name=layer2Name,
                 subObjectName="glyph",
                 subObjectID=name,
-                object2Name=self.layer1Name,
+                object2Name=layer1Name,
             )
             report.append(self.formatWarningString(text))
         report += self.reportSubObjects(self.glyphs,
@@ -306,15 +327,17 @@ class GlyphCompatibilityReporter(BaseCompatibilityReporter):
     def report(self, showOK=True, showWarnings=True):
         glyph1 = self.glyph1
         glyph2 = self.glyph2
+        glyph1Name = self.glyph1Name
+        glyph2Name = self.glyph2Name
         report = []
 
         # Contour test
         if self.contourCountDifference:
             text = self.reportCountDifference(
                 subObjectName="contours",
-                object1Name=self.glyph1Name,
+                object1Name=glyph1Name,
                 object1Count=len(glyph1),
-                object2Name=self.glyph2Name,
+                object2Name=glyph2Name,
                 object2Count=len(glyph2)
             )
             report.append(self.formatFatalString(text))
@@ -326,35 +349,35 @@ class GlyphCompatibilityReporter(BaseCompatibilityReporter):
         if self.componentCountDifference:
             text = self.reportCountDifference(
                 subObjectName="components",
-                object1Name=self.glyph1Name,
+                object1Name=glyph1Name,
                 object1Count=len(glyph1.components),
-                object2Name=self.glyph2Name,
+                object2Name=glyph2Name,
                 object2Count=len(glyph2.components)
             )
             report.append(self.formatFatalString(text))
         elif self.componentOrderDifference:
             text = self.reportOrderDifference(
                 subObjectName="components",
-                object1Name=self.glyph1Name,
+                object1Name=glyph1Name,
                 object1Order=[c.baseGlyph for c in glyph1.components],
-                object2Name=self.glyph2Name,
+                object2Name=glyph2Name,
                 object2Order=[c.baseGlyph for c in glyph2.components]
             )
             report.append(self.formatWarningString(text))
         for name in self.componentsMissingFromGlyph2:
             text = self.reportDifferences(
-                object1Name=self.glyph1Name,
+                object1Name=glyph1Name,
                 subObjectName="component",
                 subObjectID=name,
-                object2Name=self.glyph2Name,
+                object2Name=glyph2Name,
             )
             report.append(self.formatWarningString(text))
         for name in self.componentsMissingFromGlyph1:
             text = self.reportDifferences(
-                object1Name=self.glyph2Name,
+                object1Name=glyph2Name,
                 subObjectName="component",
                 subObjectID=name,
-                object2Name=self.glyph1Name,
+                object2Name=glyph1Name,
             )
             report.append(self.formatWarningString(text))
 
@@ -362,35 +385,35 @@ class GlyphCompatibilityReporter(BaseCompatibilityReporter):
         if self.anchorCountDifference:
             text = self.reportCountDifference(
                 subObjectName="anchors",
-                object1Name=self.glyph1Name,
+                object1Name=glyph1Name,
                 object1Count=len(glyph1.anchors),
-                object2Name=self.glyph2Name,
+                object2Name=glyph2Name,
                 object2Count=len(glyph2.anchors)
             )
             report.append(self.formatWarningString(text))
         elif self.anchorOrderDifference:
             text = self.reportOrderDifference(
                 subObjectName="anchors",
-                object1Name=self.glyph1Name,
+                object1Name=glyph1Name,
                 object1Order=[a.name for a in glyph1.anchors],
-                object2Name=self.glyph2Name,
+                object2Name=glyph2Name,
                 object2Order=[a.name for a in glyph2.anchors]
             )
             report.append(self.formatWarningString(text))
         for name in self.anchorsMissingFromGlyph2:
             text = self.reportDifferences(
-                object1Name=self.glyph1Name,
+                object1Name=glyph1Name,
                 subObjectName="anchor",
                 subObjectID=name,
-                object2Name=self.glyph2Name,
+                object2Name=glyph2Name,
             )
             report.append(self.formatWarningString(text))
         for name in self.anchorsMissingFromGlyph1:
             text = self.reportDifferences(
-                object1Name=self.glyph2Name,
+                object1Name=glyph2Name,
                 subObjectName="anchor",
                 subObjectID=name,
-                object2Name=self.glyph1Name,
+                object2Name=glyph1Name,
             )
             report.append(self.formatWarningString(text))
 
@@ -398,26 +421,26 @@ class GlyphCompatibilityReporter(BaseCompatibilityReporter):
         if self.guidelineCountDifference:
             text = self.reportCountDifference(
                 subObjectName="guidelines",
-                object1Name=self.glyph1Name,
+                object1Name=glyph1Name,
                 object1Count=len(glyph1.guidelines),
-                object2Name=self.glyph2Name,
+                object2Name=glyph2Name,
                 object2Count=len(glyph2.guidelines)
             )
             report.append(self.formatWarningString(text))
         for name in self.guidelinesMissingFromGlyph2:
             text = self.reportDifferences(
-                object1Name=self.glyph1Name,
+                object1Name=glyph1Name,
                 subObjectName="guideline",
                 subObjectID=name,
-                object2Name=self.glyph2Name,
+                object2Name=glyph2Name,
             )
             report.append(self.formatWarningString(text))
         for name in self.guidelinesMissingFromGlyph1:
             text = self.reportDifferences(
-                object1Name=self.glyph2Name,
+                object1Name=glyph2Name,
                 subObjectName="guideline",
                 subObjectID=name,
-                object2Name=self.glyph1Name,
+                object2Name=glyph1Name,
             )
             report.append(self.formatWarningString(text))
 
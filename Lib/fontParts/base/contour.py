@@ -815,7 +815,7 @@ class BaseContour(
     # ------
 
     def _setContourInPoint(self, point):
-        if point.contour is None:
+        if point._contour is None:
             point.contour = self
 
     points = dynamicProperty("points")
@@ -824,8 +824,12 @@ class BaseContour(
         """
         Subclasses may override this method.
         """
-        return tuple([self._getitem__points(i)
-                     for i in range(self._len__points())])
+        points = []
+        for index in range(self._lenPoints()):
+            point = self._getPoint(index)
+            self._setContourInPoint(point)
+            points.append(point)
+        return tuple(points)
 
     def _len__points(self):
         return self._lenPoints()
@@ -858,10 +862,10 @@ class BaseContour(
         self.raiseNotImplementedError()
 
     def _getPointIndex(self, point):
-        for i, other in enumerate(self.points):
-            if point == other:
-                return i
-        raise FontPartsError("The point could not be found.")
+        try:
+            return self.points.index(point)
+        except ValueError:
+            raise FontPartsError("The point could not be found.")
 
     def appendPoint(self, position=None, type="line", smooth=False, name=None, identifier=None, point=None):
         """
@@ -1,6 +1,10 @@
 import os
 from fontParts.base.errors import FontPartsError
-from fontParts.base.base import dynamicProperty, InterpolationMixin
+from fontParts.base.base import (
+    dynamicProperty,
+    InterpolationMixin,
+    appendGuidelineCopies
+)
 from fontParts.base.layer import _BaseGlyphVendor
 from fontParts.base import normalizers
 from fontParts.base.compatibility import FontCompatibilityReporter
@@ -92,8 +96,8 @@ class BaseFont(
             else:
                 layer = self.newLayer(layerName)
             layer.copyData(source.getLayer(layerName))
-        for guideline in self.guidelines:
-            self.appendGuideline(guideline)
+        for guideline in appendGuidelineCopies(self, source.guidelines):
+            guideline.font = self
         super(BaseFont, self).copyData(source)
 
     # ---------------
@@ -347,17 +351,18 @@ class BaseFont(
             env[key] = value
         environmentOptions = env
         ext = self.generateFormatToExtension(format, "." + format)
-        if path is None and self.path is None:
+        fontPath = self.path
+        if path is None and fontPath is None:
             raise IOError(("The file cannot be generated because an "
                            "output path was not defined."))
         elif path is None:
-            path = os.path.splitext(self.path)[0]
+            path = os.path.splitext(fontPath)[0]
             path += ext
         elif os.path.isdir(path):
-            if self.path is None:
+            if fontPath is None:
                 raise IOError(("The file cannot be generated because "
                                "the file does not have a path."))
-            fileName = os.path.basename(self.path)
+            fileName = os.path.basename(fontPath)
             fileName += ext
             path = os.path.join(path, fileName)
         path = normalizers.normalizeFilePath(path)
@@ -674,7 +679,9 @@ class BaseFont(
     # default layer
 
     def _setFontInLayer(self, layer):
-        if layer.font is None:
+        # Check the stored reference directly instead of
+        # going through the font property on every access.
+        if layer._font is None:
             layer.font = self
 
     defaultLayerName = dynamicProperty(
@@ -1196,7 +1203,7 @@ class BaseFont(
     # ----------
 
     def _setFontInGuideline(self, guideline):
-        if guideline.font is None:
+        if guideline._font is None and guideline._glyph is None:
             guideline.font = self
 
     guidelines = dynamicProperty(
@@ -1221,8 +1228,12 @@ class BaseFont(
 
         Subclasses may override this method.
         """
-        return tuple([self._getitem__guidelines(i)
-                      for i in range(self._len__guidelines())])
+        guidelines = []
+        for index in range(self._lenGuidelines()):
+            guideline = self._getGuideline(index)
+            self._setFontInGuideline(guideline)
+            guidelines.append(guideline)
+        return tuple(guidelines)
 
     def _len__guidelines(self):
         return self._lenGuidelines()
@@ -1255,10 +1266,10 @@ class BaseFont(
         self.raiseNotImplementedError()
 
     def _getGuidelineIndex(self, guideline):
-        for i, other in enumerate(self.guidelines):
-            if guideline == other:
-                return i
-        raise FontPartsError("The guideline could not be found.")
+        try:
+            return self.guidelines.index(guideline)
+        except ValueError:
+            raise FontPartsError("The guideline could not be found.")
 
     def appendGuideline(self, position=None, angle=None, name=None, color=None, guideline=None):
         """
@@ -1298,12 +1309,8 @@ class BaseFont(
                 existing = set([g.identifier for g in self.guidelines if g.identifier is not None])
                 if guideline.identifier not in existing:
                     identifier = guideline.identifier
-        position = normalizers.normalizeCoordinateTuple(position)
-        angle = normalizers.normalizeRotationAngle(angle)
-        if name is not None:
-            name = normalizers.normalizeGuidelineName(name)
-        if color is not None:
-            color = normalizers.normalizeColor(color)
+        position, angle, name, color = normalizers.normalizeGuidelineArguments(
+            position, angle, name=name, color=color)
         identifier = normalizers.normalizeIdentifier(identifier)
         guideline = self._appendGuideline(position, angle, name=name, color=color, identifier=identifier)
         guideline.font = self
@@ -1368,8 +1375,8 @@ class BaseFont(
 
         Subclasses may override this method.
         """
-        for _ in range(self._len__guidelines()):
-            self.removeGuideline(-1)
+        for index in reversed(range(self._lenGuidelines())):
+            self._removeGuideline(index)
 
     # -------------
     # Interpolation
@@ -1395,11 +1402,12 @@ class BaseFont(
         such incompatibilities are found.
         """
         factor = normalizers.normalizeInterpolationFactor(factor)
-        if not isinstance(minFont, BaseFont):
+        selfType = type(self)
+        if type(minFont) is not selfType and not isinstance(minFont, BaseFont):
             raise TypeError(("Interpolation to an instance of %r can not be "
                              "performed from an instance of %r.")
                             % (self.__class__.__name__, minFont.__class__.__name__))
-        if not isinstance(maxFont, BaseFont):
+        if type(maxFont) is not selfType and not isinstance(maxFont, BaseFont):
             raise TypeError(("Interpolation to an instance of %r can not be "
                              "performed from an instance of %r.")
                             % (self.__class__.__name__, maxFont.__class__.__name__))
@@ -1417,16 +1425,28 @@ class BaseFont(
         Subclasses may override this method.
         """
         # layers
-        for layerName in self.layerOrder:
+        # existing layers that are also in both sources are
+        # reused instead of being removed and created again.
+        # reused layers are reset to what a new layer would be.
+        maxLayerNames = set(maxFont.layerOrder)
+        layerNames = [layerName for layerName in minFont.layerOrder
+                      if layerName in maxLayerNames]
+        existingLayerNames = set(self.layerOrder)
+        for layerName in existingLayerNames.difference(layerNames):
             self.removeLayer(layerName)
-        for layerName in minFont.layerOrder:
-            if layerName not in maxFont.layerOrder:
-                continue
+        for layerName in layerNames:
             minLayer = minFont.getLayer(layerName)
             maxLayer = maxFont.getLayer(layerName)
-            dstLayer = self.newLayer(layerName)
+            if layerName in existingLayerNames:
+                dstLayer = self.getLayer(layerName)
+                dstLayer.color = None
+                dstLayer.lib.clear()
+            else:
+                dstLayer = self.newLayer(layerName)
             dstLayer.interpolate(factor, minLayer, maxLayer,
                                  round=round, suppressError=suppressError)
+        if self.layerOrder != layerNames:
+            self.layerOrder = layerNames
         if self.layerOrder:
             self.defaultLayer = self.getLayer(self.layerOrder[0])
         # kerning and groups
@@ -1438,7 +1458,7 @@ class BaseFont(
 
     compatibilityReporterClass = FontCompatibilityReporter
 
-    def isCompatible(self, other):
+    def isCompatible(self, other, stopOnFatal=False):
         """
         Evaluate interpolation compatibility with **other**.
 
@@ -1446,14 +1466,20 @@ class BaseFont(
             >>> compatible
             False
             >>> report
-            [Fatal] Glyph: "test1" + "test2"
-            [Fatal] Glyph: "test1" contains 1 contours | "test2" contains 2 contours
+            [Fatal] Font: "font1" + "font2"
+            [Fatal] Layer: "foreground" + "foreground"
+            [Fatal] Glyph: "A" + "A"
+            [Fatal] Glyph: "A" contains 1 contours | "A" contains 2 contours
 
         This will return a ``bool`` indicating if the font is
         compatible for interpolation with **other** and a
-        :ref:`type-string` of compatibility notes.
+        :ref:`type-string` of compatibility notes. If
+        **stopOnFatal** is ``True``, the layers and glyphs will
+        not be evaluated any further once a fatal incompatibility
+        has been found and the report will be incomplete.
         """
-        return super(BaseFont, self).isCompatible(other, BaseFont)
+        return super(BaseFont, self).isCompatible(other, BaseFont,
+                                                  stopOnFatal=stopOnFatal)
 
     def _isCompatible(self, other, reporter):
         """
@@ -1466,42 +1492,61 @@ class BaseFont(
         font2 = other
 
         # incompatible guidelines
-        guidelines1 = set(font1.guidelines)
-        guidelines2 = set(font2.guidelines)
-        if len(guidelines1) != len(guidelines2):
-            reporter.warning = True
-            reporter.guidelineCountDifference = True
-        if len(guidelines1.difference(guidelines2)) != 0:
-            reporter.warning = True
-            reporter.guidelinesMissingFromFont2 = list(
-                guidelines1.difference(guidelines2))
-        if len(guidelines2.difference(guidelines1)) != 0:
-            reporter.warning = True
-            reporter.guidelinesMissingInFont1 = list(
-                guidelines2.difference(guidelines1))
+        # the guideline objects are only built if
+        # at least one of the fonts has guidelines.
+        if font1._len__guidelines() or font2._len__guidelines():
+            guidelines1 = set(font1.guidelines)
+            guidelines2 = set(font2.guidelines)
+            if len(guidelines1) != len(guidelines2):
+                reporter.warning = True
+                reporter.guidelineCountDifference = True
+            missing = guidelines1.difference(guidelines2)
+            if missing:
+                reporter.warning = True
+                reporter.guidelinesMissingFromFont2 = list(missing)
+            missing = guidelines2.difference(guidelines1)
+            if missing:
+                reporter.warning = True
+                reporter.guidelinesMissingInFont1 = list(missing)
         # incompatible layers
-        layers1 = set(font1.layerOrder)
-        layers2 = set(font2.layerOrder)
-        if len(layers1) != len(layers2):
-            reporter.warning = True
-            reporter.layerCountDifference = True
-        if len(layers1.difference(layers2)) != 0:
-            reporter.warning = True
-            reporter.layersMissingFromFont2 = list(layers1.difference(layers2))
-        if len(layers2.difference(layers1)) != 0:
-            reporter.warning = True
-            reporter.layersMissingInFont1 = list(layers2.difference(layers1))
+        # a name to layer mapping is built once for each font.
+        # the layers are in layer order, so this also replaces
+        # reading layerOrder, which would wrap every layer again.
+        layerObjects1 = {layer.name: layer for layer in font1.layers}
+        layerObjects2 = {layer.name: layer for layer in font2.layers}
+        if layerObjects1.keys() != layerObjects2.keys():
+            if len(layerObjects1) != len(layerObjects2):
+                reporter.warning = True
+                reporter.layerCountDifference = True
+            # one pass over each font collects the missing
+            # layers in the order they appear in the font.
+            missing = [layerName for layerName in layerObjects1
+                       if layerName not in layerObjects2]
+            if missing:
+                reporter.warning = True
+                reporter.layersMissingFromFont2 = missing
+            missing = [layerName for layerName in layerObjects2
+                       if layerName not in layerObjects1]
+            if missing:
+                reporter.warning = True
+                reporter.layersMissingInFont1 = missing
         # test layers
-        for layerName in sorted(layers1.intersection(layers2)):
-            layer1 = font1.getLayer(layerName)
-            layer2 = font2.getLayer(layerName)
-            layerCompatibility = layer1.isCompatible(layer2)[1]
+        # the layers are visited in the order of the first
+        # font, so no sort is needed.
+        for layerName, layer1 in layerObjects1.items():
+            if layerName not in layerObjects2:
+                continue
+            layer2 = layerObjects2[layerName]
+            layerCompatibility = layer1.isCompatible(
+                layer2, stopOnFatal=reporter.stopOnFatal)[1]
             if layerCompatibility.fatal or layerCompatibility.warning:
                 if layerCompatibility.fatal:
                     reporter.fatal = True
                 if layerCompatibility.warning:
                     reporter.warning = True
                 reporter.layers.append(layerCompatibility)
+                if reporter.fatal and reporter.stopOnFatal:
+                    break
 
     # -------
     # mapping
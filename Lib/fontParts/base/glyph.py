@@ -12,7 +12,8 @@ from fontParts.base.base import (
     InterpolationMixin,
     SelectionMixin,
     dynamicProperty,
-    interpolate
+    interpolate,
+    appendGuidelineCopies
 )
 from fontParts.base import normalizers
 from fontParts.base.compatibility import GlyphCompatibilityReporter
@@ -83,8 +84,8 @@ class BaseGlyph(BaseObject,
             self.appendComponent(component=component)
         for anchor in source.anchors:
             self.appendAnchor(anchor=anchor)
-        for guideline in source.guidelines:
-            self.appendGuideline(guideline=guideline)
+        for guideline in appendGuidelineCopies(self, source.guidelines):
+            guideline.glyph = self
         sourceImage = source.image
         if sourceImage.data is not None:
             selfImage = self.addImage(data=sourceImage.data)
@@ -130,7 +131,7 @@ class BaseGlyph(BaseObject,
     def _get_font(self):
         if self._layer is None:
             return None
-        return self.layer.font
+        return self._layer.font
 
     # --------------
     # Identification
@@ -277,7 +278,7 @@ class BaseGlyph(BaseObject,
 
         Subclasses may override this method.
         """
-        values = self.unicodes
+        values = self._get_unicodes()
         if values:
             return values[0]
         return None
@@ -290,9 +291,9 @@ class BaseGlyph(BaseObject,
         Subclasses may override this method.
         """
         if value is None:
-            self.unicodes = []
+            self._set_unicodes([])
         else:
-            self.unicodes = [value]
+            self._set_unicodes([value])
 
     def autoUnicodes(self):
         """
@@ -397,9 +398,10 @@ class BaseGlyph(BaseObject,
 
         Subclasses may override this method.
         """
-        diff = value - self.leftMargin
-        self.moveBy((diff, 0))
-        self.width += diff
+        xMin, yMin, xMax, yMax = self.bounds
+        diff = value - xMin
+        self._moveBy((diff, 0))
+        self._set_width(self._get_width() + diff)
 
     rightMargin = dynamicProperty(
         "base_rightMargin",
@@ -435,7 +437,7 @@ class BaseGlyph(BaseObject,
         if bounds is None:
             return None
         xMin, yMin, xMax, yMax = bounds
-        return self.width - xMax
+        return self._get_width() - xMax
 
     def _set_rightMargin(self, value):
         """
@@ -445,10 +447,10 @@ class BaseGlyph(BaseObject,
         """
         bounds = self.bounds
         if bounds is None:
-            self.width = value
+            self._set_width(value)
         else:
             xMin, yMin, xMax, yMax = bounds
-            self.width = xMax + value
+            self._set_width(xMax + value)
 
     # vertical
 
@@ -532,9 +534,10 @@ class BaseGlyph(BaseObject,
 
         Subclasses may override this method.
         """
-        diff = value - self.bottomMargin
-        self.moveBy((0, diff))
-        self.height += diff
+        xMin, yMin, xMax, yMax = self.bounds
+        diff = value - yMin
+        self._moveBy((0, diff))
+        self._set_height(self._get_height() + diff)
 
     topMargin = dynamicProperty(
         "base_topMargin",
@@ -570,7 +573,7 @@ class BaseGlyph(BaseObject,
         if bounds is None:
             return None
         xMin, yMin, xMax, yMax = bounds
-        return self.height - yMax
+        return self._get_height() - yMax
 
     def _set_topMargin(self, value):
         """
@@ -580,10 +583,10 @@ class BaseGlyph(BaseObject,
         """
         bounds = self.bounds
         if bounds is None:
-            self.height = value
+            self._set_height(value)
         else:
             xMin, yMin, xMax, yMax = bounds
-            self.height = yMax + value
+            self._set_height(yMax + value)
 
     # ----
     # Pens
@@ -625,7 +628,7 @@ class BaseGlyph(BaseObject,
             >>> glyph.draw(pen, components=False)
         """
         if contours:
-            for contour in self:
+            for contour in self.contours:
                 contour.draw(pen)
         if components:
             for component in self.components:
@@ -649,7 +652,7 @@ class BaseGlyph(BaseObject,
             >>> glyph.drawPoints(pointPen, components=False)
         """
         if contours:
-            for contour in self:
+            for contour in self.contours:
                 contour.drawPoints(pen)
         if components:
             for component in self.components:
@@ -725,22 +728,22 @@ class BaseGlyph(BaseObject,
         """
         Subclasses may override this method.
         """
-        other = other.copy()
-        if offset != (0, 0):
-            other.moveBy(offset)
+        dx, dy = offset
         for contour in other.contours:
-            self.appendContour(contour)
+            self.appendContour(contour, offset)
         for component in other.components:
-            self.appendComponent(component=component)
+            ox, oy = component.offset
+            self.appendComponent(component=component, offset=(ox + dx, oy + dy))
         for anchor in other.anchors:
-            self.appendAnchor(anchor=anchor)
-        for guideline in other.guidelines:
-            self.appendGuideline(guideline=guideline)
+            x, y = anchor.position
+            self.appendAnchor(anchor=anchor, position=(x + dx, y + dy))
+        for guideline in appendGuidelineCopies(self, other.guidelines, offset):
+            guideline.glyph = self
 
     # Contours
 
     def _setGlyphInContour(self, contour):
-        if contour.glyph is None:
+        if contour._glyph is None:
             contour.glyph = self
 
     contours = dynamicProperty(
@@ -758,7 +761,7 @@ class BaseGlyph(BaseObject,
         """
         Subclasses may override this method.
         """
-        return tuple([self[i] for i in range(len(self))])
+        return tuple(self._iterContours())
 
     def __len__(self):
         """
@@ -792,12 +795,10 @@ class BaseGlyph(BaseObject,
 
         Subclasses may override this method.
         """
-        count = len(self)
-        index = 0
-        while count:
-            yield self[index]
-            count -= 1
-            index += 1
+        for index in range(self._lenContours()):
+            contour = self._getContour(index)
+            self._setGlyphInContour(contour)
+            yield contour
 
     def __getitem__(self, index):
         """
@@ -825,10 +826,10 @@ class BaseGlyph(BaseObject,
         self.raiseNotImplementedError()
 
     def _getContourIndex(self, contour):
-        for i, other in enumerate(self.contours):
-            if contour == other:
-                return i
-        raise FontPartsError("The contour could not be found.")
+        try:
+            return self.contours.index(contour)
+        except ValueError:
+            raise FontPartsError("The contour could not be found.")
 
     def appendContour(self, contour, offset=None):
         """
@@ -863,11 +864,8 @@ class BaseGlyph(BaseObject,
         """
         pointPen = self.getPointPen()
         if offset != (0, 0):
-            copy = contour.copy()
-            copy.moveBy(offset)
-            copy.drawPoints(pointPen)
-        else:
-            contour.drawPoints(pointPen)
+            pointPen = _OffsetPointPen(pointPen, offset)
+        contour.drawPoints(pointPen)
         return self[-1]
 
     def removeContour(self, contour):
@@ -908,8 +906,8 @@ class BaseGlyph(BaseObject,
         """
         Subclasses may override this method.
         """
-        for _ in range(len(self)):
-            self.removeContour(-1)
+        for index in reversed(range(self._lenContours())):
+            self._removeContour(index)
 
     def removeOverlap(self):
         """
@@ -930,7 +928,7 @@ class BaseGlyph(BaseObject,
     # Components
 
     def _setGlyphInComponent(self, component):
-        if component.glyph is None:
+        if component._glyph is None:
             component.glyph = self
 
     components = dynamicProperty(
@@ -948,8 +946,12 @@ class BaseGlyph(BaseObject,
         """
         Subclasses may override this method.
         """
-        return tuple([self._getitem__components(i) for
-                     i in range(self._len__components())])
+        components = []
+        for index in range(self._lenComponents()):
+            component = self._getComponent(index)
+            self._setGlyphInComponent(component)
+            components.append(component)
+        return tuple(components)
 
     def _len__components(self):
         return self._lenComponents()
@@ -982,10 +984,10 @@ class BaseGlyph(BaseObject,
         self.raiseNotImplementedError()
 
     def _getComponentIndex(self, component):
-        for i, other in enumerate(self.components):
-            if component == other:
-                return i
-        raise FontPartsError("The component could not be found.")
+        try:
+            return self.components.index(component)
+        except ValueError:
+            raise FontPartsError("The component could not be found.")
 
     def appendComponent(self, baseGlyph=None, offset=None, scale=None, component=None):
         """
@@ -1025,8 +1027,6 @@ class BaseGlyph(BaseObject,
                 offset = (ox, oy)
             if scale is None:
                 scale = (sx, sy)
-            if baseGlyph is None:
-                baseGlyph = component.baseGlyph
             if component.identifier is not None:
                 existing = set([c.identifier for c in self.components if c.identifier is not None])
                 if component.identifier not in existing:
@@ -1034,15 +1034,18 @@ class BaseGlyph(BaseObject,
         baseGlyph = normalizers.normalizeGlyphName(baseGlyph)
         if self.name == baseGlyph:
             raise FontPartsError(("A glyph cannot contain a component referencing itself."))
-        if offset is None:
-            offset = (0, 0)
-        if scale is None:
-            scale = (1, 1)
-        offset = normalizers.normalizeTransformationOffset(offset)
-        scale = normalizers.normalizeTransformationScale(scale)
-        ox, oy = offset
-        sx, sy = scale
-        transformation = (sx, sxy, syx, sy, ox, oy)
+        if offset is None and scale is None:
+            transformation = (1, 0, 0, 1, 0, 0)
+        else:
+            if offset is None:
+                offset = (0, 0)
+            if scale is None:
+                scale = (1, 1)
+            offset = normalizers.normalizeTransformationOffset(offset)
+            scale = normalizers.normalizeTransformationScale(scale)
+            ox, oy = offset
+            sx, sy = scale
+            transformation = (sx, sxy, syx, sy, ox, oy)
         identifier = normalizers.normalizeIdentifier(identifier)
         return self._appendComponent(baseGlyph, transformation=transformation, identifier=identifier)
 
@@ -1101,8 +1104,8 @@ class BaseGlyph(BaseObject,
         """
         Subclasses may override this method.
         """
-        for _ in range(self._len__components()):
-            self.removeComponent(-1)
+        for index in reversed(range(self._lenComponents())):
+            self._removeComponent(index)
 
     def decompose(self):
         """
@@ -1122,7 +1125,7 @@ class BaseGlyph(BaseObject,
     # Anchors
 
     def _setGlyphInAnchor(self, anchor):
-        if anchor.glyph is None:
+        if anchor._glyph is None:
             anchor.glyph = self
 
     anchors = dynamicProperty(
@@ -1140,8 +1143,12 @@ class BaseGlyph(BaseObject,
         """
         Subclasses may override this method.
         """
-        return tuple([self._getitem__anchors(i) for
-                     i in range(self._len__anchors())])
+        anchors = []
+        for index in range(self._lenAnchors()):
+            anchor = self._getAnchor(index)
+            self._setGlyphInAnchor(anchor)
+            anchors.append(anchor)
+        return tuple(anchors)
 
     def _len__anchors(self):
         return self._lenAnchors()
@@ -1174,10 +1181,10 @@ class BaseGlyph(BaseObject,
         self.raiseNotImplementedError()
 
     def _getAnchorIndex(self, anchor):
-        for i, other in enumerate(self.anchors):
-            if anchor == other:
-                return i
-        raise FontPartsError("The anchor could not be found.")
+        try:
+            return self.anchors.index(anchor)
+        except ValueError:
+            raise FontPartsError("The anchor could not be found.")
 
     def appendAnchor(self, name=None, position=None, color=None, anchor=None):
         """
@@ -1272,15 +1279,15 @@ class BaseGlyph(BaseObject,
         """
         Subclasses may override this method.
         """
-        for _ in range(self._len__anchors()):
-            self.removeAnchor(-1)
+        for index in reversed(range(self._lenAnchors())):
+            self._removeAnchor(index)
 
     # ----------
     # Guidelines
     # ----------
 
     def _setGlyphInGuideline(self, guideline):
-        if guideline.glyph is None:
+        if guideline._glyph is None:
             guideline.glyph = self
 
     guidelines = dynamicProperty(
@@ -1298,8 +1305,12 @@ class BaseGlyph(BaseObject,
         """
         Subclasses may override this method.
         """
-        return tuple([self._getitem__guidelines(i) for
-                     i in range(self._len__guidelines())])
+        guidelines = []
+        for index in range(self._lenGuidelines()):
+            guideline = self._getGuideline(index)
+            self._setGlyphInGuideline(guideline)
+            guidelines.append(guideline)
+        return tuple(guidelines)
 
     def _len__guidelines(self):
         return self._lenGuidelines()
@@ -1332,10 +1343,10 @@ class BaseGlyph(BaseObject,
         self.raiseNotImplementedError()
 
     def _getGuidelineIndex(self, guideline):
-        for i, other in enumerate(self.guidelines):
-            if guideline == other:
-                return i
-        raise FontPartsError("The guideline could not be found.")
+        try:
+            return self.guidelines.index(guideline)
+        except ValueError:
+            raise FontPartsError("The guideline could not be found.")
 
     def appendGuideline(self, position=None, angle=None, name=None, color=None, guideline=None):
         """
@@ -1379,12 +1390,8 @@ class BaseGlyph(BaseObject,
                 existing = set([g.identifier for g in self.guidelines if g.identifier is not None])
                 if guideline.identifier not in existing:
                     identifier = guideline.identifier
-        position = normalizers.normalizeCoordinateTuple(position)
-        angle = normalizers.normalizeRotationAngle(angle)
-        if name is not None:
-            name = normalizers.normalizeGuidelineName(name)
-        if color is not None:
-            color = normalizers.normalizeColor(color)
+        position, angle, name, color = normalizers.normalizeGuidelineArguments(
+            position, angle, name=name, color=color)
         identifier = normalizers.normalizeIdentifier(identifier)
         guideline = self._appendGuideline(position, angle, name=name, color=color, identifier=identifier)
         guideline.glyph = self
@@ -1442,8 +1449,8 @@ class BaseGlyph(BaseObject,
         """
         Subclasses may override this method.
         """
-        for _ in range(self._len__guidelines()):
-            self.removeGuideline(-1)
+        for index in reversed(range(self._lenGuidelines())):
+            self._removeGuideline(index)
 
     # ------------------
     # Data Normalization
@@ -1527,14 +1534,18 @@ class BaseGlyph(BaseObject,
         """
         Subclasses may override this method.
         """
+        if matrix == (1, 0, 0, 1, 0, 0):
+            return
+        # the matrix has already been normalized,
+        # so hand it directly to the sub-objects.
         for contour in self.contours:
-            contour.transformBy(matrix)
+            contour._transformBy(matrix)
         for component in self.components:
-            component.transformBy(matrix)
+            component._transformBy(matrix)
         for anchor in self.anchors:
-            anchor.transformBy(matrix)
+            anchor._transformBy(matrix)
         for guideline in self.guidelines:
-            guideline.transformBy(matrix)
+            guideline._transformBy(matrix)
 
     def scaleBy(self, value, origin=None, width=False, height=False):
         """
@@ -1583,7 +1594,11 @@ class BaseGlyph(BaseObject,
 
             >>> mg = glyph.toMathGlyph()
         """
-        return self._toMathGlyph()
+        mathGlyph = self._toMathGlyph()
+        # the lib values may be shared with the glyph,
+        # so give the caller an independent copy.
+        mathGlyph.lib = deepcopy(mathGlyph.lib)
+        return mathGlyph
 
     def _toMathGlyph(self):
         """
@@ -1594,25 +1609,28 @@ class BaseGlyph(BaseObject,
         pen = mathGlyph.getPointPen()
         self.drawPoints(pen)
         for anchor in self.anchors:
-            d = dict(
-                x=anchor.x,
-                y=anchor.y,
-                name=anchor.name,
-                identifier=anchor.identifier,
-                color=anchor.color
-            )
+            d = {
+                "x": anchor.x,
+                "y": anchor.y,
+                "name": anchor.name,
+                "identifier": anchor.identifier,
+                "color": anchor.color
+            }
             mathGlyph.anchors.append(d)
         for guideline in self.guidelines:
-            d = dict(
-                x=guideline.x,
-                y=guideline.y,
-                angle=guideline.angle,
-                name=guideline.name,
-                identifier=guideline.identifier,
-                color=guideline.color
-            )
+            d = {
+                "x": guideline.x,
+                "y": guideline.y,
+                "angle": guideline.angle,
+                "name": guideline.name,
+                "identifier": guideline.identifier,
+                "color": guideline.color
+            }
             mathGlyph.guidelines.append(d)
-        mathGlyph.lib = deepcopy(self.lib)
+        # fontMath deep copies the lib into every glyph
+        # it creates, so the values don't need to be
+        # copied for the math operations here.
+        mathGlyph.lib = self.lib.asDict()
         mathGlyph.name = self.name
         mathGlyph.unicodes = self.unicodes
         mathGlyph.width = self.width
@@ -1766,7 +1784,6 @@ class BaseGlyph(BaseObject,
         from fontMath.mathFunctions import setRoundIntegerFunction
 
         setRoundIntegerFunction(normalizers.normalizeVisualRounding)
-        
         minGlyph = minGlyph._toMathGlyph()
         maxGlyph = maxGlyph._toMathGlyph()
         try:
@@ -1794,7 +1811,7 @@ class BaseGlyph(BaseObject,
                 reporter.warning = True
             reporterObject.append(compatibility)
 
-    def isCompatible(self, other):
+    def isCompatible(self, other, stopOnFatal=False):
         """
         Evaluate the interpolation compatibility of this glyph
         and ``other``.
@@ -1805,9 +1822,13 @@ class BaseGlyph(BaseObject,
 
         This will return a :ref:`type-bool` indicating if this glyph is
         compatible with ``other`` and a :class:`GlyphCompatibilityReporter`
-        containing a detailed report about compatibility errors.
+        containing a detailed report about compatibility errors. If
+        ``stopOnFatal`` is ``True``, the glyphs will not be evaluated
+        any further once a fatal incompatibility has been found and
+        the report will be incomplete.
         """
-        return super(BaseGlyph, self).isCompatible(other, BaseGlyph)
+        return super(BaseGlyph, self).isCompatible(other, BaseGlyph,
+                                                   stopOnFatal=stopOnFatal)
 
     def _isCompatible(self, other, reporter):
         """
@@ -1819,22 +1840,30 @@ class BaseGlyph(BaseObject,
         glyph1 = self
         glyph2 = other
         # contour count
-        if len(self.contours) != len(glyph2.contours):
+        # the counts come from the environment directly so
+        # that no contour objects are built just to count them.
+        contourCount1 = len(glyph1)
+        contourCount2 = len(glyph2)
+        if contourCount1 != contourCount2:
             reporter.fatal = True
             reporter.contourCountDifference = True
+            if reporter.stopOnFatal:
+                return
         # contour pairs
-        for i in range(min(len(glyph1), len(glyph2))):
-            contour1 = glyph1[i]
-            contour2 = glyph2[i]
+        for contour1, contour2 in zip(glyph1.contours, glyph2.contours):
             self._checkPairs(contour1, contour2, reporter, reporter.contours)
+            if reporter.fatal and reporter.stopOnFatal:
+                return
         # component count
-        if len(glyph1.components) != len(glyph2.components):
+        selfComponents = [component.baseGlyph for component in glyph1.components]
+        otherComponents = [component.baseGlyph for component in glyph2.components]
+        if len(selfComponents) != len(otherComponents):
             reporter.fatal = True
             reporter.componentCountDifference = True
+            if reporter.stopOnFatal:
+                return
         # component check
         component_diff = []
-        selfComponents = [component.baseGlyph for component in glyph1.components]
-        otherComponents = [component.baseGlyph for component in glyph2.components]
         for index, (left, right) in enumerate(
             zip_longest(selfComponents, otherComponents)
         ):
@@ -1868,34 +1897,32 @@ class BaseGlyph(BaseObject,
                     missing_from_glyph2.elements()
                 )
         # guideline count
-        if len(self.guidelines) != len(glyph2.guidelines):
+        selfGuidelines = [(guideline.name, i) for i, guideline
+                          in enumerate(glyph1.guidelines)]
+        otherGuidelines = [(guideline.name, i) for i, guideline
+                           in enumerate(glyph2.guidelines)]
+        if len(selfGuidelines) != len(otherGuidelines):
             reporter.warning = True
             reporter.guidelineCountDifference = True
         # guideline check
-        selfGuidelines = []
-        otherGuidelines = []
-        for source, names in ((self, selfGuidelines),
-                              (other, otherGuidelines)):
-            for i, guideline in enumerate(source.guidelines):
-                names.append((guideline.name, i))
         guidelines1 = set(selfGuidelines)
         guidelines2 = set(otherGuidelines)
-        if len(guidelines1.difference(guidelines2)) != 0:
+        missingFromGlyph2 = guidelines1.difference(guidelines2)
+        if missingFromGlyph2:
             reporter.warning = True
-            reporter.guidelinesMissingFromGlyph2 = list(
-                guidelines1.difference(guidelines2))
-        if len(guidelines2.difference(guidelines1)) != 0:
+            reporter.guidelinesMissingFromGlyph2 = list(missingFromGlyph2)
+        missingFromGlyph1 = guidelines2.difference(guidelines1)
+        if missingFromGlyph1:
             reporter.warning = True
-            reporter.guidelinesMissingFromGlyph1 = list(
-                guidelines2.difference(guidelines1))
+            reporter.guidelinesMissingFromGlyph1 = list(missingFromGlyph1)
         # anchor count
-        if len(self.anchors) != len(glyph2.anchors):
+        selfAnchors = [anchor.name for anchor in glyph1.anchors]
+        otherAnchors = [anchor.name for anchor in glyph2.anchors]
+        if len(selfAnchors) != len(otherAnchors):
             reporter.warning = True
             reporter.anchorCountDifference = True
         # anchor check
         anchor_diff = []
-        selfAnchors = [anchor.name for anchor in glyph1.anchors]
-        otherAnchors = [anchor.name for anchor in glyph2.anchors]
         for index, (left, right) in enumerate(zip_longest(selfAnchors, otherAnchors)):
             if left != right:
                 anchor_diff.append((index, left, right))
@@ -1941,6 +1968,15 @@ class BaseGlyph(BaseObject,
         """
         Subclasses may override this method.
         """
+        # a point outside of the bounding box can't be inside
+        # the glyph, so skip drawing in that case.
+        bounds = self._get_bounds()
+        if bounds is None:
+            return False
+        x, y = point
+        xMin, yMin, xMax, yMax = bounds
+        if x < xMin or x > xMax or y < yMin or y > yMax:
+            return False
         from fontTools.pens.pointInsidePen import PointInsidePen
         pen = PointInsidePen(glyphSet=None, testPoint=point, evenOdd=False)
         self.draw(pen)
@@ -2043,9 +2079,15 @@ class BaseGlyph(BaseObject,
 
         Subclasses may override this method.
         """
-        for glyph in self.layers:
-            if glyph.layer.name == name:
-                return glyph
+        font = self.font
+        if font is not None:
+            try:
+                layer = font.getLayer(name)
+            except ValueError:
+                pass
+            else:
+                if self.name in layer:
+                    return layer[self.name]
         raise ValueError("No layer named '%s' in glyph '%s'."
                          % (name, self.name))
 
@@ -2064,14 +2106,13 @@ class BaseGlyph(BaseObject,
         layerName = name
         glyphName = self.name
         layerName = normalizers.normalizeLayerName(layerName)
-        for glyph in self.layers:
-            if glyph.layer.name == layerName:
-                layer = glyph.layer
-                layer.removeGlyph(glyphName)
-                break
+        try:
+            existing = self._getLayer(layerName)
+        except ValueError:
+            pass
+        else:
+            existing.layer.removeGlyph(glyphName)
         glyph = self._newLayer(name=layerName)
-        layer = self.font.getLayer(layerName)
-        # layer._setLayerInGlyph(glyph)
         return glyph
 
     def _newLayer(self, name, **kwargs):
@@ -2185,9 +2226,8 @@ class BaseGlyph(BaseObject,
         if path is not None:
             if not os.path.exists(path):
                 raise IOError("No image located at '%s'." % path)
-            f = open(path, "rb")
-            data = f.read()
-            f.close()
+            with open(path, "rb") as f:
+                data = f.read()
         self._addImage(data=data, transformation=transformation, color=color)
         return self.image
 
@@ -2568,3 +2608,34 @@ class BaseGlyph(BaseObject,
         Subclasses may override this method.
         """
         return self._setSelectedSubObjects(self.guidelines, value)
+
+
+class _OffsetPointPen(object):
+
+    """
+    A point pen that moves everything drawn into it by ``offset``
+    and drops contour and point identifiers.
+    """
+
+    def __init__(self, outPen, offset):
+        self._outPen = outPen
+        self._dx, self._dy = offset
+
+    def beginPath(self, identifier=None, **kwargs):
+        self._outPen.beginPath(**kwargs)
+
+    def endPath(self):
+        self._outPen.endPath()
+
+    def addPoint(self, pt, segmentType=None, smooth=False, name=None,
+                 identifier=None, **kwargs):
+        x, y = pt
+        self._outPen.addPoint((x + self._dx, y + self._dy),
+                              segmentType=segmentType, smooth=smooth,
+                              name=name, **kwargs)
+
+    def addComponent(self, baseGlyphName, transformation, identifier=None,
+                     **kwargs):
+        xx, xy, yx, yy, ox, oy = transformation
+        transformation = (xx, xy, yx, yy, ox + self._dx, oy + self._dy)
+        self._outPen.addComponent(baseGlyphName, transformation, **kwargs)
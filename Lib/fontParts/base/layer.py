@@ -27,7 +27,7 @@ class _BaseGlyphVendor(
     # -----------------
 
     def _setLayerInGlyph(self, glyph):
-        if glyph.layer is None:
+        if glyph._layer is None:
             if isinstance(self, BaseLayer):
                 layer = self
             else:
@@ -669,7 +669,7 @@ class BaseLayer(_BaseGlyphVendor, InterpolationMixin, DeprecatedLayer, RemovedLa
 
         Subclasses may override this method.
         """
-        for glyphName in self.keys():
+        for glyphName in list(self.keys()):
             del self[glyphName]
         for glyphName in minLayer.keys():
             if glyphName not in maxLayer:
@@ -682,7 +682,7 @@ class BaseLayer(_BaseGlyphVendor, InterpolationMixin, DeprecatedLayer, RemovedLa
 
     compatibilityReporterClass = LayerCompatibilityReporter
 
-    def isCompatible(self, other):
+    def isCompatible(self, other, stopOnFatal=False):
         """
         Evaluate interpolation compatibility with **other**. ::
 
@@ -690,15 +690,19 @@ class BaseLayer(_BaseGlyphVendor, InterpolationMixin, DeprecatedLayer, RemovedLa
             >>> compat
             False
             >>> report
-            A
-            -
-            [Fatal] The glyphs do not contain the same number of contours.
+            [Fatal] Layer: "foreground" + "foreground"
+            [Fatal] Glyph: "A" + "A"
+            [Fatal] Glyph: "A" contains 1 contours | "A" contains 2 contours
 
         This will return a ``bool`` indicating if the layer is
         compatible for interpolation with **other** and a
-        :ref:`type-string` of compatibility notes.
+        :ref:`type-string` of compatibility notes. If
+        **stopOnFatal** is ``True``, the glyphs will not be
+        evaluated any further once a fatal incompatibility
+        has been found and the report will be incomplete.
         """
-        return super(BaseLayer, self).isCompatible(other, BaseLayer)
+        return super(BaseLayer, self).isCompatible(other, BaseLayer,
+                                                   stopOnFatal=stopOnFatal)
 
     def _isCompatible(self, other, reporter):
         """
@@ -726,13 +730,16 @@ class BaseLayer(_BaseGlyphVendor, InterpolationMixin, DeprecatedLayer, RemovedLa
         for glyphName in sorted(glyphs1.intersection(glyphs2)):
             glyph1 = layer1[glyphName]
             glyph2 = layer2[glyphName]
-            glyphCompatibility = glyph1.isCompatible(glyph2)[1]
+            glyphCompatibility = glyph1.isCompatible(
+                glyph2, stopOnFatal=reporter.stopOnFatal)[1]
             if glyphCompatibility.fatal or glyphCompatibility.warning:
                 if glyphCompatibility.fatal:
                     reporter.fatal = True
                 if glyphCompatibility.warning:
                     reporter.warning = True
                 reporter.glyphs.append(glyphCompatibility)
+                if reporter.fatal and reporter.stopOnFatal:
+                    break
 
     # -------
     # mapping
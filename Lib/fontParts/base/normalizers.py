@@ -321,8 +321,7 @@ def normalizeGlyphUnicodes(value):
         raise TypeError("Glyph unicodes must be a list, not %s."
                         % type(value).__name__)
     values = [normalizeGlyphUnicode(v) for v in value]
-    duplicates = [v for v, count in Counter(value).items() if count > 1]
-    if len(duplicates) != 0:
+    if len(set(values)) != len(values):
         raise ValueError("Duplicate unicode values are not allowed.")
     return tuple(values)
 
@@ -712,6 +711,28 @@ def normalizeGuidelineName(value):
     return value
 
 
+def normalizeGuidelineArguments(position, angle, name=None, color=None):
+    """
+    Normalizes the values used to create a guideline.
+
+    * **position** is normalized with :func:`normalizeCoordinateTuple`.
+    * **angle** is normalized with :func:`normalizeRotationAngle`.
+    * **name** is normalized with :func:`normalizeGuidelineName`
+      if it is not ``None``.
+    * **color** is normalized with :func:`normalizeColor`
+      if it is not ``None``.
+    * Returned value is a ``tuple`` of the normalized
+      position, angle, name and color.
+    """
+    position = normalizeCoordinateTuple(position)
+    angle = normalizeRotationAngle(angle)
+    if name is not None:
+        name = normalizeGuidelineName(name)
+    if color is not None:
+        color = normalizeColor(color)
+    return position, angle, name, color
+
+
 # -------
 # Generic
 # -------
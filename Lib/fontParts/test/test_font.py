@@ -54,6 +54,18 @@ class TestFont(unittest.TestCase):
         self.assertEqual(src.color, dst.color)
         self.assertEqual(src.identifier, dst.identifier)
 
+    def test_copy_guidelines(self):
+        font = self.getFont_guidelines()
+        copied = font.copy()
+        self.assertEqual(
+            [(g.position, g.angle, g.name) for g in copied.guidelines],
+            [((1, 2), 0, "Test Guideline 1"), ((3, 4), 90, "Test Guideline 2")]
+        )
+        self.assertEqual(
+            [g.font for g in copied.guidelines],
+            [copied, copied]
+        )
+
     # glyphOrder
 
     def test_glyphOrder(self):
@@ -113,6 +125,81 @@ class TestFont(unittest.TestCase):
         font["A"] = glyph
         self.assertEqual(font["A"].unicode, 123)
 
+    # -------------
+    # Interpolation
+    # -------------
+
+    def test_interpolate_layers(self):
+        minFont = self.getFont_layers()
+        maxFont = self.getFont_layers()
+        maxFont.removeLayer("layer B")
+        for font, width in ((minFont, 100), (maxFont, 200)):
+            for layer in font.layers:
+                layer.newGlyph("A").width = width
+        font, _ = self.objectGenerator("font")
+        reused = font.newLayer("layer A")
+        reused.newGlyph("Z")
+        reused.color = (1, 0, 0, 1)
+        reused.lib["stale"] = True
+        font.newLayer("layer X")
+        font.interpolate(0.5, minFont, maxFont)
+        expected = [name for name in minFont.layerOrder
+                    if name in maxFont.layerOrder]
+        self.assertEqual(font.layerOrder, expected)
+        for layer in font.layers:
+            self.assertEqual(list(layer.keys()), ["A"])
+            self.assertEqual(layer["A"].width, 150)
+            self.assertIsNone(layer.color)
+            self.assertEqual(dict(layer.lib), {})
+
+    def test_isCompatible(self):
+        font1 = self.getFont_glyphs()
+        font2 = self.getFont_glyphs()
+        compatible, report = font1.isCompatible(font2)
+        self.assertTrue(compatible)
+        self.assertFalse(report.warning)
+
+    def test_isCompatible_fatal(self):
+        font1 = self.getFont_glyphs()
+        font2 = self.getFont_glyphs()
+        for name in "AB":
+            pen = font2[name].getPen()
+            pen.moveTo((0, 0))
+            pen.lineTo((100, 0))
+            pen.lineTo((100, 100))
+            pen.closePath()
+        compatible, report = font1.isCompatible(font2)
+        self.assertFalse(compatible)
+        self.assertEqual(len(report.layers), 1)
+        self.assertEqual(len(report.layers[0].glyphs), 2)
+
+    def test_isCompatible_stopOnFatal(self):
+        font1 = self.getFont_glyphs()
+        font2 = self.getFont_glyphs()
+        for name in "AB":
+            pen = font2[name].getPen()
+            pen.moveTo((0, 0))
+            pen.lineTo((100, 0))
+            pen.lineTo((100, 100))
+            pen.closePath()
+        compatible, report = font1.isCompatible(font2, stopOnFatal=True)
+        self.assertFalse(compatible)
+        self.assertEqual(len(report.layers), 1)
+        self.assertEqual(len(report.layers[0].glyphs), 1)
+
+    def test_isCompatible_layers(self):
+        font1 = self.getFont_layers()
+        font2 = self.getFont_layers()
+        font1.removeLayer("layer B")
+        font2.removeLayer("layer A")
+        font2.removeLayer("layer C")
+        compatible, report = font1.isCompatible(font2)
+        self.assertTrue(compatible)
+        self.assertTrue(report.warning)
+        self.assertTrue(report.layerCountDifference)
+        self.assertEqual(report.layersMissingFromFont2, ["layer A", "layer C"])
+        self.assertEqual(report.layersMissingInFont1, ["layer B"])
+
     # ----
     # flatKerning
     # ----
@@ -238,6 +238,18 @@ class TestGlyph(unittest.TestCase):
             (100, -10, 200, 100)
         )
 
+    def test_pointInside_true(self):
+        glyph = self.getGlyph_generic()
+        self.assertTrue(glyph.pointInside((105, 50)))
+
+    def test_pointInside_false_outside_bounds(self):
+        glyph = self.getGlyph_generic()
+        self.assertFalse(glyph.pointInside((300, 50)))
+
+    def test_pointInside_false_empty(self):
+        glyph, _ = self.objectGenerator("glyph")
+        self.assertFalse(glyph.pointInside((0, 0)))
+
     # ------
     # Layers
     # ------
@@ -390,6 +402,50 @@ class TestGlyph(unittest.TestCase):
         self.assertEqual(len(glyph_one.anchors), 6)
         self.assertEqual(len(glyph_one.guidelines), 6)
 
+    def test_appendGlyph_offset(self):
+        glyph_one, _ = self.objectGenerator("glyph")
+        glyph_two = self.getGlyph_generic()
+        glyph_two.appendComponent("component 1", offset=(10, 20))
+        glyph_one.appendGlyph(glyph_two, (300, -40))
+        self.assertEqual(
+            [(p.x, p.y) for p in glyph_one[0].points],
+            [(p.x + 300, p.y - 40) for p in glyph_two[0].points]
+        )
+        self.assertEqual(glyph_one.components[0].offset, (310, -20))
+        self.assertEqual(glyph_one.anchors[0].position, (301, -38))
+        self.assertEqual(glyph_one.guidelines[1].position, (303, -36))
+        self.assertEqual(glyph_two.anchors[0].position, (1, 2))
+
+    def test_appendContour_offset_identifiers(self):
+        glyph = self.getGlyph_generic()
+        contour = glyph[0]
+        contour.getIdentifier()
+        for point in contour.points:
+            point.getIdentifier()
+        glyph.appendContour(contour, offset=(20, 0))
+        self.assertEqual(len(glyph), 3)
+        self.assertEqual(
+            [(p.x, p.y) for p in glyph[2].points],
+            [(p.x + 20, p.y) for p in contour.points]
+        )
+        self.assertIsNone(glyph[2].identifier)
+        self.assertEqual(
+            [p.identifier for p in glyph[2].points],
+            [None] * len(contour.points)
+        )
+
+    def test_copy_guidelines(self):
+        glyph = self.getGlyph_generic()
+        copied = glyph.copy()
+        self.assertEqual(
+            [(g.position, g.angle, g.name) for g in copied.guidelines],
+            [((1, 2), 0, "Test Guideline 1"), ((3, 4), 90, "Test Guideline 2")]
+        )
+        self.assertEqual(
+            [g.glyph for g in copied.guidelines],
+            [copied, copied]
+        )
+
     # --------
     # Contours
     # --------
@@ -453,6 +509,16 @@ class TestGlyph(unittest.TestCase):
         with self.assertRaises(FontPartsError):
             glyph.appendComponent(glyph.name)
 
+    def test_appendComponent_valid_default_transformation(self):
+        glyph = self.getGlyph_generic()
+        dst = glyph.appendComponent("test")
+        self.assertEqual(dst.transformation, (1, 0, 0, 1, 0, 0))
+
+    def test_appendComponent_valid_offset(self):
+        glyph = self.getGlyph_generic()
+        dst = glyph.appendComponent("test", offset=(10, 20))
+        self.assertEqual(dst.transformation, (1, 0, 0, 1, 10, 20))
+
     def test_appendComponent_valid_object(self):
         glyph = self.getGlyph_generic()
         src, _ = self.objectGenerator("component")
@@ -639,6 +705,20 @@ class TestGlyph(unittest.TestCase):
         glyph.clearGuidelines()
         self.assertEqual(len(glyph.guidelines), 0)
 
+    # -----
+    # Round
+    # -----
+
+    def test_round(self):
+        glyph = self.getGlyph_generic()
+        glyph.moveBy((0.5, 1.4))
+        glyph.width = 250.5
+        glyph.round()
+        self.assertEqual(glyph.bounds, (101, -9, 201, 101))
+        self.assertEqual(glyph.anchors[0].position, (2, 3))
+        self.assertEqual(glyph.guidelines[0].position, (2, 3))
+        self.assertEqual(glyph.width, 251)
+
     # -----
     # Image
     # -----
@@ -1148,6 +1228,22 @@ class TestGlyph(unittest.TestCase):
         self.assertEqual(report.componentsMissingFromGlyph1, ["a", "b"])
         self.assertEqual(report.componentsMissingFromGlyph2, ["x", "y"])
 
+    def test_isCompatible_stopOnFatal(self):
+        glyph1, _ = self.objectGenerator("glyph")
+        glyph1.appendComponent("a")
+        glyph1.appendAnchor("x", (0, 0))
+        glyph2, _ = self.objectGenerator("glyph")
+        glyph2.appendComponent("a")
+        glyph2.appendComponent("b")
+        is_compatible, report = glyph1.isCompatible(glyph2, stopOnFatal=True)
+        self.assertFalse(is_compatible)
+        self.assertTrue(report.componentCountDifference)
+        self.assertFalse(report.anchorCountDifference)
+        is_compatible, report = glyph1.isCompatible(glyph2)
+        self.assertFalse(is_compatible)
+        self.assertTrue(report.componentCountDifference)
+        self.assertTrue(report.anchorCountDifference)
+
     # -------------
     # Interpolation
     # -------------
@@ -1176,6 +1272,20 @@ class TestGlyph(unittest.TestCase):
             1515
         )
 
+    def test_toMathGlyph_lib_copied(self):
+        glyph = self.getGlyph_generic()
+        glyph.lib["test"] = [1]
+        mathGlyph = glyph.toMathGlyph()
+        mathGlyph.lib["test"].append(2)
+        self.assertEqual(glyph.lib["test"], [1])
+
+    def test_mul_lib_copied(self):
+        glyph = self.getGlyph_generic()
+        glyph.lib["test"] = [1]
+        result = glyph * 2
+        result.lib["test"].append(2)
+        self.assertEqual(glyph.lib["test"], [1])
+
     # ---------------
     # Transformations
     # ---------------
@@ -57,6 +57,40 @@ class TestLayer(unittest.TestCase):
         with self.assertRaises(KeyError):
             layer["E"]
 
+    # -------------
+    # Compatibility
+    # -------------
+
+    def test_isCompatible_fatal(self):
+        layer1 = self.getLayer_glyphs()
+        layer2 = self.getLayer_glyphs()
+        for name in "AB":
+            pen = layer2[name].getPen()
+            pen.moveTo((0, 0))
+            pen.lineTo((100, 0))
+            pen.lineTo((100, 100))
+            pen.closePath()
+        compatible, report = layer1.isCompatible(layer2)
+        self.assertFalse(compatible)
+        self.assertEqual(len(report.glyphs), 2)
+
+    def test_isCompatible_stopOnFatal(self):
+        layer1 = self.getLayer_glyphs()
+        layer2 = self.getLayer_glyphs()
+        for name in "AB":
+            pen = layer2[name].getPen()
+            pen.moveTo((0, 0))
+            pen.lineTo((100, 0))
+            pen.lineTo((100, 100))
+            pen.closePath()
+        layer1["A"].appendComponent("B")
+        compatible, report = layer1.isCompatible(layer2, stopOnFatal=True)
+        self.assertFalse(compatible)
+        self.assertEqual(len(report.glyphs), 1)
+        glyphReport = report.glyphs[0]
+        self.assertTrue(glyphReport.contourCountDifference)
+        self.assertFalse(glyphReport.componentCountDifference)
+
     # ----
     # Hash
     # ----
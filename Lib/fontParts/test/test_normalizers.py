@@ -400,6 +400,10 @@ class TestNormalizers(unittest.TestCase):
         with self.assertRaises(ValueError):
             normalizers.normalizeGlyphUnicodes([1, 2, 3, 2])
 
+    def test_normalizeGlyphUnicodes_invalidDuplicateMembersHex(self):
+        with self.assertRaises(ValueError):
+            normalizers.normalizeGlyphUnicodes([1, 2, "0002"])
+
     def test_normalizeGlyphUnicodes_invalidMember(self):
         with self.assertRaises(ValueError):
             normalizers.normalizeGlyphUnicodes([1, 2, "xyz"])
@@ -1033,6 +1037,21 @@ class TestNormalizers(unittest.TestCase):
         with self.assertRaises(ValueError):
             normalizers.normalizeGuidelineName("")
 
+    # normalizeGuidelineArguments
+
+    def test_normalizeGuidelineArguments_valid(self):
+        result = normalizers.normalizeGuidelineArguments(
+            [1, 2], -90, name="A", color=(1, 0, 0, 1))
+        self.assertEqual(result, ((1, 2), 270.0, "A", (1.0, 0.0, 0.0, 1.0)))
+
+    def test_normalizeGuidelineArguments_none(self):
+        result = normalizers.normalizeGuidelineArguments((1, 2), 0)
+        self.assertEqual(result, ((1, 2), 0.0, None, None))
+
+    def test_normalizeGuidelineArguments_invalidAngle(self):
+        with self.assertRaises(ValueError):
+            normalizers.normalizeGuidelineArguments((1, 2), 361)
+
     # -------
     # Generic
     # -------